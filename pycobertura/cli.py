@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import click
 
 from pycobertura.cobertura import Cobertura, CoberturaDiff
@@ -298,10 +300,15 @@ def diff(
         source2 = get_dir_from_file_path(cobertura_file2)
 
     filesystem1 = filesystem_factory(source1, source_prefix=source_prefix1)
-    cobertura1 = Cobertura(cobertura_file1, filesystem=filesystem1)
-
     filesystem2 = filesystem_factory(source2, source_prefix=source_prefix2)
-    cobertura2 = Cobertura(cobertura_file2, filesystem=filesystem2)
+
+    # lxml releases the GIL while parsing, so both reports are loaded
+    # concurrently.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(Cobertura, cobertura_file1, filesystem=filesystem1)
+        future2 = executor.submit(Cobertura, cobertura_file2, filesystem=filesystem2)
+        cobertura1 = future1.result()
+        cobertura2 = future2.result()
 
     Reporter = delta_reporters[format]
     reporter_args = [cobertura1, cobertura2, ignore_regex]
@@ -1,23 +1,48 @@
+import re
 import lxml.etree as ET
 from collections import namedtuple
+from types import MappingProxyType
 from pycobertura.utils import (
     LineStatus,
     LineStatusTuple,
     extrapolate_coverage,
-    get_line_status,
+    get_line_status_from_attributes,
     reconcile_lines,
     hunkify_lines,
     get_filenames_that_do_not_match_regex,
     memoize,
 )
 
-from typing import Dict, List, Tuple
+from typing import List, Mapping, Tuple
 
 try:
     from typing import Literal
 except ImportError:  # pragma: no cover
     from typing_extensions import Literal
 
+# The number syntax accepted by libxml2's XPath `number()` conversion, once
+# surrounding whitespace is stripped. The exponent digits are optional.
+_XPATH_NUMBER = re.compile(
+    r"(-?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+))(?:[eE]([+-]?[0-9]*))?"
+)
+
+
+def _has_positive_hits(hits):
+    """
+    Return `True` if the `hits` attribute value `hits` is a number greater
+    than zero, with the same result as the XPath test `@hits>0`. A missing
+    value, or one that is not an XPath number, is not.
+    """
+    if hits is None:
+        return False
+    match = _XPATH_NUMBER.fullmatch(hits.strip(" \t\r\n"))
+    if match is None:
+        return False
+    number, exponent = match.groups()
+    if exponent and exponent not in ("+", "-"):
+        number = f"{number}e{exponent}"
+    return float(number) > 0
+
 
 class Line(namedtuple("Line", ["number", "source", "status", "reason"])):
     """
@@ -33,6 +58,9 @@ class Line(namedtuple("Line", ["number", "source", "status", "reason"])):
     """
 
 
+_LineCounts = namedtuple("LineCounts", ["statements", "hits", "misses"])
+
+
 class Cobertura:
     """
     An XML Cobertura parser.
@@ -86,7 +114,7 @@ The following exceptions occurred while attempting to parse the report:
 
     def _make_class_elements_by_filename(self):
         result = {}
-        for elem in self.xml.xpath("./packages//class"):
+        for elem in self.xml.iterfind("packages//class"):
             filename = elem.attrib["filename"]
             result.setdefault(filename, []).append(elem)
 
@@ -95,11 +123,23 @@ The following exceptions occurred while attempting to parse the report:
     def __eq__(self, other):
         return self.report and other.report and self.report == other.report
 
+    def _make_parser(self):
+        # Coverage reports are plain data: comments, ignorable whitespace and
+        # entities are of no use, and large reports must not trip libxml2's
+        # size limits. lxml parsers must not be shared between threads, so one
+        # is created per load.
+        return ET.XMLParser(
+            remove_blank_text=True,
+            remove_comments=True,
+            resolve_entities=False,
+            huge_tree=True,
+        )
+
     def _load_from_file(self, report_file):
-        return ET.parse(report_file).getroot()
+        return ET.parse(report_file, parser=self._make_parser()).getroot()
 
     def _load_from_string(self, s):
-        return ET.fromstring(s)
+        return ET.fromstring(s, parser=self._make_parser())
 
     @memoize
     def _get_lines_by_filename(self, filename):
@@ -107,9 +147,45 @@ The following exceptions occurred while attempting to parse the report:
         return [
             line
             for classElement in classElements
-            for line in classElement.xpath("./lines/line")
+            for line in classElement.iterfind("lines/line")
         ]
 
+    @memoize
+    def _get_line_columns_by_filename(self, filename):
+        """
+        Return the line numbers, whether each line was executed (`hits` > 0)
+        and the statuses of the lines of the file `filename` as three parallel
+        lists. The line elements are read once and every per-line query of the
+        file is answered from these lists.
+        """
+        numbers: List[int] = []
+        executed: List[bool] = []
+        statuses: List[LineStatus] = []
+        for line in self._get_lines_by_filename(filename):
+            line_hits = line.get("hits")
+            condition = line.get("condition-coverage")
+            numbers.append(int(line.get("number")))
+            executed.append(_has_positive_hits(line_hits))
+            statuses.append(get_line_status_from_attributes(line_hits, condition))
+
+        return numbers, executed, statuses
+
+    @memoize
+    def _get_line_counts_by_filename(self, filename):
+        """
+        Return the statement, hit and miss counts of the file `filename` as a
+        `_LineCounts` namedtuple, computed in a single pass over its lines.
+        """
+        numbers, executed, statuses = self._get_line_columns_by_filename(filename)
+        total_hits = total_misses = 0
+        for line_executed, status in zip(executed, statuses):
+            if status != "hit":
+                total_misses += 1
+            elif line_executed:
+                total_hits += 1
+
+        return _LineCounts(len(numbers), total_hits, total_misses)
+
     @property
     def version(self):
         """Return the version number of the coverage report."""
@@ -152,13 +228,8 @@ The following exceptions occurred while attempting to parse the report:
         Return a list of uncovered line numbers for each of the missed
         statements found for the file `filename`.
         """
-        classElements = self._class_elements_by_file_name[filename]
-        return [
-            int(line.get("number"))
-            for classElement in classElements
-            for line in classElement.xpath("./lines/line")
-            if get_line_status(line) != "hit"
-        ]
+        numbers, _, statuses = self._get_line_columns_by_filename(filename)
+        return [lineno for lineno, status in zip(numbers, statuses) if status != "hit"]
 
     @memoize
     def hit_statements(self, filename):
@@ -166,12 +237,11 @@ The following exceptions occurred while attempting to parse the report:
         Return a list of covered line numbers for each of the hit statements
         found for the file `filename`.
         """
-        classElements = self._class_elements_by_file_name[filename]
+        numbers, executed, statuses = self._get_line_columns_by_filename(filename)
         return [
-            int(line.get("number"))
-            for classElement in classElements
-            for line in classElement.xpath("./lines/line[@hits>0]")
-            if get_line_status(line) == "hit"
+            lineno
+            for lineno, line_executed, status in zip(numbers, executed, statuses)
+            if line_executed and status == "hit"
         ]
 
     def line_statuses(self, filename: str):
@@ -181,16 +251,18 @@ The following exceptions occurred while attempting to parse the report:
         the line number and `status` is coverage status of the line which can
         be either `True` (line hit) or `False` (line miss).
         """
-        line_elements = self._get_lines_by_filename(filename)
-
-        output: List[LineStatusTuple] = []
-        for line in line_elements:
-            lineno = int(line.get("number"))
-            status = get_line_status(line)
-            output.append((lineno, status))
-
+        numbers, _, statuses = self._get_line_columns_by_filename(filename)
+        output: List[LineStatusTuple] = list(zip(numbers, statuses))
         return output
 
+    @memoize
+    def _get_line_statuses_by_lineno(self, filename):
+        """
+        Return a read-only mapping `{lineno: status}` of the lines of the file
+        `filename`. It is built once and shared by every caller.
+        """
+        return MappingProxyType(dict(self.line_statuses(filename)))
+
     def missed_lines(self, filename):
         """
         Return a list of extrapolated uncovered or partially uncovered line
@@ -224,7 +296,7 @@ The following exceptions occurred while attempting to parse the report:
         lines = []
         try:
             with self.filesystem.open(filename) as f:
-                line_statuses = dict(self.line_statuses(filename))
+                line_statuses = self._get_line_statuses_by_lineno(filename)
                 for lineno, source in enumerate(f, start=1):
                     line_status = line_statuses.get(lineno)
                     line = Line(lineno, source, line_status, None)
@@ -242,13 +314,11 @@ The following exceptions occurred while attempting to parse the report:
         number of uncovered statements for all files.
         """
         if filename is not None:
-            return len(self.missed_statements(filename))
+            return self._get_line_counts_by_filename(filename).misses
 
         return sum(
-            [
-                len(self.missed_statements(filename))
-                for filename in self.files(ignore_regex)
-            ]
+            self._get_line_counts_by_filename(filename).misses
+            for filename in self.files(ignore_regex)
         )
 
     def total_hits(self, filename=None, ignore_regex=None):
@@ -258,12 +328,10 @@ The following exceptions occurred while attempting to parse the report:
         number of covered statements for all files.
         """
         if filename is not None:
-            return len(self.hit_statements(filename))
+            return self._get_line_counts_by_filename(filename).hits
         return sum(
-            [
-                len(self.hit_statements(filename))
-                for filename in self.files(ignore_regex)
-            ]
+            self._get_line_counts_by_filename(filename).hits
+            for filename in self.files(ignore_regex)
         )
 
     def total_statements(self, filename=None, ignore_regex=None):
@@ -273,12 +341,10 @@ The following exceptions occurred while attempting to parse the report:
         number of statements for all files.
         """
         if filename is not None:
-            return len(self._get_lines_by_filename(filename))
+            return self._get_line_counts_by_filename(filename).statements
         return sum(
-            [
-                len(self._get_lines_by_filename(filename))
-                for filename in self.files(ignore_regex)
-            ]
+            self._get_line_counts_by_filename(filename).statements
+            for filename in self.files(ignore_regex)
         )
 
     @memoize
@@ -286,16 +352,7 @@ The following exceptions occurred while attempting to parse the report:
         """
         Return the list of available files in the coverage report.
         """
-        # maybe replace with a trie at some point? see has_file FIXME
-        already_seen = set()
-        filenames = []
-
-        for el in self.xml.xpath("//class"):
-            filename = el.get("filename")
-            if filename in already_seen:
-                continue
-            already_seen.add(filename)
-            filenames.append(filename)
+        filenames = list(self._class_elements_by_file_name)
 
         return (
             filenames
@@ -308,8 +365,7 @@ The following exceptions occurred while attempting to parse the report:
         Return `True` if the file `filename` is present in the report, return
         `False` otherwise.
         """
-        # FIXME: this will lookup a list which is slow, make it O(1)
-        return filename in self.files()
+        return filename in self._class_elements_by_file_name
 
     @memoize
     def source_lines(self, filename: str):
@@ -327,7 +383,7 @@ The following exceptions occurred while attempting to parse the report:
         """
         Return the list of available packages in the coverage report.
         """
-        return [el.get("name") for el in self.xml.xpath("//package")]
+        return [el.get("name") for el in self.xml.iter("package")]
 
 
 class CoberturaDiff:
@@ -441,17 +497,17 @@ class CoberturaDiff:
             filename
         ):
             lines1 = self.cobertura1.source_lines(filename)
-            line_statuses1 = dict(self.cobertura1.line_statuses(filename))
+            line_statuses1 = self.cobertura1._get_line_statuses_by_lineno(filename)
             nonexistent = False
         else:
             lines1 = []
-            line_statuses1: Dict[int, LineStatus] = {}
+            line_statuses1: Mapping[int, LineStatus] = {}
 
         if self.cobertura2.has_file(filename) and self.cobertura2.filesystem.has_file(
             filename
         ):
             lines2 = self.cobertura2.source_lines(filename)
-            line_statuses2 = dict(self.cobertura2.line_statuses(filename))
+            line_statuses2 = self.cobertura2._get_line_statuses_by_lineno(filename)
             nonexistent = False
         else:
             lines2 = []
@@ -467,9 +523,9 @@ class CoberturaDiff:
         # if we are using a single coverage file, we need to translate the
         # coverage of lines1 so that it corresponds to its real lines.
         if self.cobertura1 == self.cobertura2:
-            line_statuses1 = {}
-            for l2, l1 in lineno_map.items():
-                line_statuses1[l1] = line_statuses2.get(l2)
+            line_statuses1 = {
+                l1: line_statuses2.get(l2) for l2, l1 in lineno_map.items()
+            }
 
         lines = []
         for lineno, source in enumerate(lines2, start=1):
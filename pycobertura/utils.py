@@ -275,13 +275,13 @@ def get_filenames_that_do_not_match_regex(
         ignore_patterns = get_non_empty_non_commented_lines_from_file_in_ascii(
             regex_param, comment_character
         )
-        remove_filenames = [
+        remove_filenames = {
             filename
             for igp in ignore_patterns
             for filename in fnmatch.filter(filenames, igp)
-        ]
+        }
     else:
-        remove_filenames = list(filter(re.compile(regex_param).match, filenames))
+        remove_filenames = set(filter(re.compile(regex_param).match, filenames))
     return [fname for fname in filenames if fname not in remove_filenames]
 
 
@@ -290,7 +290,16 @@ def get_line_status(line):
     Returns the line status as "hit", "miss", or "partial". Line is an XML
     Element from a Cobertura report of type `line`.
     """
-    condition = line.get("condition-coverage")
+    return get_line_status_from_attributes(
+        line.get("hits"), line.get("condition-coverage")
+    )
+
+
+def get_line_status_from_attributes(hits, condition):
+    """
+    Like `get_line_status`, but takes the already read `hits` and
+    `condition-coverage` attribute values of a `line` XML Element.
+    """
     status: LineStatus
     if condition:
         if condition.startswith("100%"):
@@ -300,7 +309,7 @@ def get_line_status(line):
         else:
             status = "partial"
     else:
-        status: LineStatus = "miss" if line.get("hits") == "0" else "hit"
+        status = "miss" if hits == "0" else "hit"
 
     return status
 
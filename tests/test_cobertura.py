@@ -34,6 +34,15 @@ def test_parse_string():
     assert ET.tostring(Cobertura(xml_path).xml) == ET.tostring(Cobertura(xml_string).xml)
 
 
+def test_parse_drops_comments_and_blank_text():
+    from pycobertura import Cobertura
+
+    cobertura = Cobertura(
+        '<coverage>\n  <!-- comment -->\n  <packages/>\n</coverage>'
+    )
+    assert ET.tostring(cobertura.xml) == b'<coverage><packages/></coverage>'
+
+
 def test_invalid_coverage_report():
     from pycobertura import Cobertura
 
@@ -104,6 +113,54 @@ def test_missed_statements_by_class_file():
             expected_missed_statements[filename]
 
 
+def test_non_integer_hits():
+    from pycobertura import Cobertura
+
+    cobertura = Cobertura(
+        '<coverage><packages><package name=""><classes>'
+        '<class filename="a.py"><lines>'
+        '<line number="1" hits="1.0"/>'
+        '<line number="2" hits="0"/>'
+        '<line number="3" hits=""/>'
+        '<line number="4" hits="+1"/>'
+        '<line number="5" hits="inf"/>'
+        '<line number="6" hits="1_000"/>'
+        '</lines></class>'
+        '</classes></package></packages></coverage>'
+    )
+    assert cobertura.line_statuses('a.py') == [
+        (1, 'hit'), (2, 'miss'), (3, 'hit'), (4, 'hit'), (5, 'hit'), (6, 'hit'),
+    ]
+    assert cobertura.missed_statements('a.py') == [2]
+    assert cobertura.hit_statements('a.py') == [1]
+    assert cobertura.total_statements('a.py') == 6
+
+
+@pytest.mark.parametrize("hits", [
+    "1", "0", "1.0", "", " 2 ", "\t3\n", ".5", "1.", "-1", "-0.5", "00",
+    "+1", "inf", "Infinity", "nan", "1_000", "- 1", ".", " 1 2", "\u0663",
+    "1e3", "1E3", "1e-3", "1e+3", ".5e1", "1.e2", "1e", "1e+", "e3",
+    "-1e3", "1e400", "1e-400", "0e5",
+])
+def test_has_positive_hits_matches_xpath(hits):
+    from pycobertura.cobertura import _has_positive_hits
+
+    line = ET.Element('line', hits=hits)
+    assert _has_positive_hits(hits) is bool(line.xpath('@hits>0'))
+
+
+def test_has_positive_hits_missing():
+    from pycobertura.cobertura import _has_positive_hits
+
+    assert _has_positive_hits(None) is False
+
+
+def test_has_file():
+    cobertura = make_cobertura()
+    assert cobertura.has_file('search/BinarySearch.java')
+    assert not cobertura.has_file('search/NonExistent.java')
+
+
 def test_list_packages():
     cobertura = make_cobertura()
 
@@ -305,6 +362,14 @@ def test_line_statuses(report, expected_line_statuses):
             expected_line_statuses[filename]
 
 
+def test_line_statuses_by_lineno_is_read_only():
+    cobertura = make_cobertura("tests/dummy.with-branch-condition/coverage.xml")
+    line_statuses = cobertura._get_line_statuses_by_lineno('dummy.py')
+    assert line_statuses == {1: 'hit', 2: 'partial', 3: 'hit', 5: 'miss'}
+    with pytest.raises(TypeError):
+        line_statuses[1] = 'miss'
+
+
 @pytest.mark.parametrize("report, source, source_prefix", [
     ("tests/dummy.source1/coverage.xml", None, None),
     ("tests/dummy.source1/coverage.xml", "tests/", "dummy.source1/"),
@@ -1,6 +1,6 @@
 from typing import Union
 import pytest
-from pycobertura.utils import get_line_status
+from pycobertura.utils import get_line_status, get_line_status_from_attributes
 
 class FakeLine:
     def __init__(self, hits: str, condition_coverage: Union[str, None]):
@@ -25,3 +25,13 @@ class FakeLine:
 ])
 def test_get_line_status(line, expected_output):
     assert get_line_status(line) == expected_output
+
+@pytest.mark.parametrize("hits, condition_coverage, expected_output", [
+    ("0", None, "miss"),
+    ("1", None, "hit"),
+    ("1", "50% (1/2)", "partial"),
+    ("1", "100% (2/2)", "hit"),
+    ("0", "0% (0/2)", "miss"),
+])
+def test_get_line_status_from_attributes(hits, condition_coverage, expected_output):
+    assert get_line_status_from_attributes(hits, condition_coverage) == expected_output